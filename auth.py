@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from anyio import CapacityLimiter, to_thread
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 import os
 from dotenv import load_dotenv
@@ -24,12 +26,26 @@ if not SECRET_KEY or SECRET_KEY == "your-secret-key-here-change-in-production":
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing - argon2id for new hashes (faster than bcrypt at
+# equivalent security and releases the GIL while hashing); bcrypt stays
+# listed so existing hashes keep verifying and are re-hashed on login
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+
+# The register/login flows are dominated by CPU-bound argon2 hashing, so
+# they are offloaded to a bounded threadpool instead of stalling the
+# event loop
+_auth_limiter = CapacityLimiter(os.cpu_count() or 4)
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Reusable statement - built once, compiled SQL is cached across requests
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """Look up a user by email using the cached statement"""
+    return db.scalars(_USER_BY_EMAIL, {"email": email}).first()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -94,7 +110,7 @@ def get_current_user(
     token = credentials.credentials
     token_data = decode_token(token)
     
-    user = db.query(User).filter(User.email == token_data.email).first()
+    user = get_user_by_email(db, token_data.email)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -104,9 +120,36 @@ def get_current_user(
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate user with email and password"""
-    user = db.query(User).filter(User.email == email).first()
+    user = get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = pwd_context.verify_and_update(password, user.password_hash)
+    if not valid:
         return None
+    if new_hash:
+        # Deprecated (bcrypt) hash: upgrade to argon2 now that we have the
+        # plaintext - the only moment a re-hash is possible
+        user.password_hash = new_hash
+        db.commit()
     return user
+
+async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[User]:
+    """Authenticate user without blocking the event loop on the hash check"""
+    return await to_thread.run_sync(authenticate_user, db, email, password, limiter=_auth_limiter)
+
+def register_user(db: Session, email: str, password: str) -> User:
+    """Create a new user, rejecting duplicate emails"""
+    if get_user_by_email(db, email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    new_user = User(email=email, password_hash=get_password_hash(password))
+    db.add(new_user)
+    db.commit()
+    db.refresh(new_user)
+    return new_user
+
+async def register_user_async(db: Session, email: str, password: str) -> User:
+    """Run the whole register flow (lookup, hash, DB writes) off the event loop"""
+    return await to_thread.run_sync(register_user, db, email, password, limiter=_auth_limiter)
@@ -9,6 +9,19 @@ load_dotenv()
 # Database URL from environment variable
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hirelens.db")
 
+# Connection pool tuning (non-SQLite backends)
+# Note: the database server's max_connections must be at least
+# workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "25"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "50"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# pre_ping issues an extra SELECT 1 round-trip on every checkout, so it is
+# opt-in; stale connections are handled by recycling instead. Keep the recycle
+# interval below the server's idle-connection timeout.
+DB_PRE_PING = os.getenv("DB_PRE_PING", "0") == "1"
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 # Create engine with connection pooling for better performance
 if "sqlite" in DATABASE_URL:
     # SQLite specific configuration
@@ -16,17 +29,20 @@ if "sqlite" in DATABASE_URL:
         DATABASE_URL,
         connect_args={"check_same_thread": False},
         echo=False,
-        pool_pre_ping=True  # Verify connections before using
+        pool_pre_ping=DB_PRE_PING,  # Opt-in connection verification
+        query_cache_size=1200  # Larger compiled-statement cache for hot queries
     )
 else:
     # PostgreSQL/other databases configuration
     engine = create_engine(
         DATABASE_URL,
         echo=False,
-        pool_size=10,  # Connection pool size
-        max_overflow=20,  # Max overflow connections
-        pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=3600  # Recycle connections after 1 hour
+        pool_size=DB_POOL_SIZE,  # Connection pool size
+        max_overflow=DB_MAX_OVERFLOW,  # Max overflow connections
+        pool_timeout=DB_POOL_TIMEOUT,  # Seconds to wait for a free connection
+        pool_pre_ping=DB_PRE_PING,  # Opt-in connection verification
+        pool_recycle=DB_POOL_RECYCLE,  # Recycle connections before they go stale
+        query_cache_size=1200  # Larger compiled-statement cache for hot queries
     )
 
 # Create session factory
@@ -15,9 +15,12 @@ from pathlib import Path
 # Add backend directory to path
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
+from sqlalchemy import insert, select
+
 from database import engine, SessionLocal, init_db
 from models import User, Job
 from auth import get_password_hash
+from utils.skill_extractor import canonicalize_skills
 from datetime import datetime
 
 def create_sample_jobs():
@@ -112,18 +115,29 @@ Nice to have:
     ]
     
     print("Creating sample job postings...")
-    
+
+    # Check all existing titles in one query instead of one per job
+    titles = [job_data["title"] for job_data in sample_jobs]
+    existing_titles = set(
+        db.scalars(select(Job.title).where(Job.title.in_(titles))).all()
+    )
+
+    to_insert = [
+        {**job_data, "required_skills": canonicalize_skills(job_data["required_skills"])}
+        for job_data in sample_jobs if job_data["title"] not in existing_titles
+    ]
+
     for job_data in sample_jobs:
-        # Check if job already exists
-        existing = db.query(Job).filter(Job.title == job_data["title"]).first()
-        if not existing:
-            job = Job(**job_data)
-            db.add(job)
-            print(f"  ✓ Created: {job_data['title']}")
-        else:
+        if job_data["title"] in existing_titles:
             print(f"  ⚠ Skipped (exists): {job_data['title']}")
-    
-    db.commit()
+        else:
+            print(f"  ✓ Created: {job_data['title']}")
+
+    # Single executemany INSERT for all missing jobs (2 roundtrips total instead of 2N)
+    if to_insert:
+        db.execute(insert(Job), to_insert)
+        db.commit()
+
     db.close()
     print("✅ Sample jobs created successfully!")
 
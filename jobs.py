@@ -1,16 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from database import get_db
+from database import engine, get_db
 from auth import get_current_user
 from models import User, Resume, Job, JobMatch
-from schema import JobCreate, JobResponse, JobMatchRequest, JobMatchResponse
+from resume import get_user_resume
+from schema import JobCreate, JobListItem, JobResponse, JobMatchRequest, JobMatchResponse
 from utils.matcher import calculate_match_score, get_match_interpretation
+from utils.skill_extractor import canonicalize_skills
 from utils.ai_feedback import get_ai_feedback
 
 router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
 
+# Cache completed match computations (score + AI feedback) keyed by content
+# hashes - the AI call dominates latency, so repeat submissions of the same
+# resume/job pair become a dict lookup. A changed resume or job description
+# naturally produces a new key, so no explicit invalidation is needed.
+_match_cache = {}
+_MATCH_CACHE_MAX = 1024
+
+def _match_cache_key(resume_text: str, job_description: str) -> tuple:
+    h1 = hashlib.sha256(resume_text.encode()).hexdigest()
+    h2 = hashlib.sha256(job_description.encode()).hexdigest()
+    return (h1, h2)
+
+def persist_job_matches(db: Session, match_dicts: List[dict]) -> None:
+    """
+    Bulk-insert job match rows with a single executemany INSERT
+
+    One multi-row VALUES statement instead of a per-row add()+flush(),
+    which is an order of magnitude faster for batches.
+    """
+    if not match_dicts:
+        return
+    db.execute(insert(JobMatch), match_dicts)
+    db.commit()
+
+def jobs_with_matching_skills(db: Session, skills: List[str]) -> List[Job]:
+    """
+    Find jobs sharing at least one required skill with the given list
+
+    On Postgres the overlap test runs server-side via the jsonb ?| operator
+    (backed by the GIN index on Job.required_skills); other backends fall
+    back to a Python-side intersection. The ?| operator compares strings
+    exactly, so both the probe array here and the write paths canonicalize
+    skills to the extractor's Title Case for consistent results.
+    """
+    if not skills:
+        return []
+
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy import cast
+        from sqlalchemy.dialects.postgresql import array, JSONB
+        stmt = select(Job).where(
+            cast(Job.required_skills, JSONB).op('?|')(array(canonicalize_skills(skills)))
+        )
+        return db.scalars(stmt).all()
+
+    # Fallback: intersect in Python (SQLite has no jsonb operators)
+    wanted = {s.lower() for s in skills}
+    return [
+        job for job in db.scalars(select(Job)).all()
+        if wanted & {s.lower() for s in (job.required_skills or [])}
+    ]
+
 @router.post("/create", response_model=JobResponse)
 def create_job(
     job_data: JobCreate,
@@ -22,7 +79,9 @@ def create_job(
     new_job = Job(
         title=job_data.title,
         description=job_data.description,
-        required_skills=job_data.required_skills
+        # Canonical Title Case so server-side skill comparisons match the
+        # extractor's output regardless of how the client cased them
+        required_skills=canonicalize_skills(job_data.required_skills)
     )
     
     db.add(new_job)
@@ -31,14 +90,23 @@ def create_job(
     
     return new_job
 
-@router.get("/list", response_model=List[JobResponse])
+@router.get("/list", response_model=List[JobListItem])
 def get_jobs(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = Query(None, gt=0, description="Return jobs with id below this value"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all available jobs"""
-    jobs = db.query(Job).all()
-    return jobs
+    """
+    Get available jobs (paginated)
+
+    - Projects only id/title/created_at; fetch /api/jobs/{job_id} for the description
+    - Pass the smallest id from the previous page as `cursor` to get the next page
+    """
+    stmt = select(Job.id, Job.title, Job.created_at).order_by(Job.id.desc()).limit(limit)
+    if cursor is not None:
+        stmt = stmt.where(Job.id < cursor)
+    return db.execute(stmt).all()
 
 @router.post("/match", response_model=JobMatchResponse)
 def match_job(
@@ -55,11 +123,8 @@ def match_job(
     """
     
     # Get resume
-    resume = db.query(Resume).filter(
-        Resume.id == match_request.resume_id,
-        Resume.user_id == current_user.id
-    ).first()
-    
+    resume = get_user_resume(db, match_request.resume_id, current_user.id)
+
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,13 +139,29 @@ def match_job(
                 detail="Job description is too short. Minimum 10 characters required."
             )
         
+        # Serve repeat submissions of the same resume/job pair from cache
+        cache_key = _match_cache_key(resume.raw_text, match_request.job_description)
+        cached = _match_cache.get(cache_key)
+        if cached:
+            match_result, feedback_text = cached
+            return JobMatchResponse(
+                match_percentage=match_result["match_percentage"],
+                missing_skills=match_result["missing_skills"],
+                matched_skills=match_result["matched_skills"],
+                ai_feedback=feedback_text
+            )
+
         # Calculate match score
         match_result = calculate_match_score(
             resume.raw_text,
             match_request.job_description
         )
-        
-        # Get AI feedback
+
+        # Get AI feedback. Only real provider responses are cacheable -
+        # degraded feedback (provider outage or local fallback text) must not
+        # be pinned for the process lifetime, mirroring the feedback-layer
+        # cache policy.
+        cacheable = False
         try:
             ai_feedback = get_ai_feedback(
                 resume_text=resume.raw_text[:3000],
@@ -88,7 +169,8 @@ def match_job(
                 job_description=match_request.job_description,
                 missing_skills=match_result["missing_skills"]
             )
-            
+            cacheable = not ai_feedback.get("is_fallback", False)
+
             feedback_text = f"""
 ATS Score: {ai_feedback['ats_score']}/100
 
@@ -112,9 +194,17 @@ Technical Skills Missing: {len(match_result['missing_technical_skills'])}
 Focus on acquiring: {', '.join(match_result['missing_technical_skills'][:5])}
             """
         
+        # Cache the finished computation (bounded; drop the oldest entry)
+        if cacheable:
+            if len(_match_cache) >= _MATCH_CACHE_MAX:
+                # Concurrent evictions may race on the same key; the default
+                # keeps the loser from raising KeyError
+                _match_cache.pop(next(iter(_match_cache)), None)
+            _match_cache[cache_key] = (match_result, feedback_text)
+
         # Store match result (optional - for job matching history)
         # You could create a Job entry if needed
-        
+
         response = JobMatchResponse(
             match_percentage=match_result["match_percentage"],
             missing_skills=match_result["missing_skills"],
@@ -130,29 +220,93 @@ Focus on acquiring: {', '.join(match_result['missing_technical_skills'][:5])}
             detail=f"Error matching job: {str(e)}"
         )
 
-@router.get("/matches/{resume_id}")
-def get_resume_matches(
+@router.get("/recommend/{resume_id}", response_model=List[JobResponse])
+def recommend_jobs(
     resume_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all job matches for a specific resume"""
-    
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
-    
+    """Get jobs that share at least one skill with the given resume"""
+
+    resume = get_user_resume(db, resume_id, current_user.id)
+
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found"
         )
-    
-    matches = db.query(JobMatch).filter(JobMatch.resume_id == resume_id).all()
-    
+
+    jobs = jobs_with_matching_skills(db, resume.extracted_skills or [])
+
+    # Record the new pairings for match history in one bulk INSERT
+    existing_job_ids = set(
+        db.scalars(select(JobMatch.job_id).where(JobMatch.resume_id == resume_id)).all()
+    )
+    resume_skills = {s.lower() for s in (resume.extracted_skills or [])}
+
+    match_dicts = []
+    for job in jobs:
+        if job.id in existing_job_ids:
+            continue
+        required = job.required_skills or []
+        matched = [s for s in required if s.lower() in resume_skills]
+        missing = [s for s in required if s.lower() not in resume_skills]
+        match_percentage = round(len(matched) / len(required) * 100, 2) if required else 0.0
+        match_dicts.append({
+            "resume_id": resume_id,
+            "job_id": job.id,
+            "match_percentage": match_percentage,
+            "missing_skills": missing
+        })
+
+    persist_job_matches(db, match_dicts)
+
+    return jobs
+
+@router.get("/matches/{resume_id}")
+def get_resume_matches(
+    resume_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all job matches for a specific resume"""
+
+    # Single round-trip: the join through resumes doubles as the ownership
+    # check. The job relationship is deliberately not eager-loaded - it is
+    # never serialized, so loading it would only bloat the payload.
+    matches = db.scalars(
+        select(JobMatch)
+        .join(Resume, JobMatch.resume_id == Resume.id)
+        .where(Resume.id == resume_id, Resume.user_id == current_user.id)
+    ).all()
+
+    if not matches:
+        # Empty result: distinguish "no matches yet" from "not your resume"
+        if not get_user_resume(db, resume_id, current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+
     return {
         "resume_id": resume_id,
         "total_matches": len(matches),
         "matches": matches
     }
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get a single job including its full description"""
+    job = db.get(Job, job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    return job
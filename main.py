@@ -1,18 +1,16 @@
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 from datetime import timedelta
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 import os
 
 from database import get_db, init_db
 from auth import (
-    get_password_hash, 
-    authenticate_user, 
-    create_access_token, 
+    register_user_async,
+    authenticate_user_async,
+    create_access_token,
     get_current_user,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
@@ -29,16 +27,32 @@ from schema import (
 from resume import router as resume_router
 from jobs import router as jobs_router
 
-# Security Headers Middleware
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        return response
+# Security headers, pre-encoded once so each response only extends the raw
+# ASGI header list
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+]
+
+# Security Headers Middleware (pure ASGI - avoids the per-request
+# Response/Request objects that BaseHTTPMiddleware builds)
+class SecurityHeadersMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + _SECURITY_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -46,7 +60,8 @@ app = FastAPI(
     description="AI Resume Analyzer & Job Matcher",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # orjson is much faster on large payloads
 )
 
 # Add security headers middleware
@@ -65,9 +80,18 @@ app.add_middleware(
 )
 
 # Initialize database on startup
+# DB_AUTO_CREATE=1 (default, for local dev) runs create_all on boot.
+# Set DB_AUTO_CREATE=0 in production and apply schema changes out-of-band
+# (e.g. alembic upgrade head) - with multiple uvicorn workers every process
+# would otherwise race the same DDL introspection on each deploy.
 @app.on_event("startup")
 def startup_event():
-    init_db()
+    if os.getenv("DB_AUTO_CREATE", "1") == "1":
+        init_db()
+    # Warm the spaCy model so the first upload doesn't pay the ~300-500ms
+    # load; the heavy pipeline components are already disabled in the loader
+    from utils.skill_extractor import get_nlp_model
+    get_nlp_model()
     print("🚀 HireLens AI API is running!")
     print("📚 API Documentation: http://localhost:8000/docs")
 
@@ -80,37 +104,20 @@ app.include_router(jobs_router)
 # ============================================
 
 @app.post("/api/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """
     Register a new user
-    
+
     - Email must be unique
-    - Password is hashed using bcrypt
+    - Password is hashed using argon2
     """
-    
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    new_user = User(
-        email=user_data.email,
-        password_hash=hashed_password
-    )
-    
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    
-    return new_user
+
+    # Lookup, hashing and the DB writes all run in the bounded threadpool
+    # so the event loop never blocks on either the hash or DB I/O
+    return await register_user_async(db, user_data.email, user_data.password)
 
 @app.post("/api/login", response_model=Token)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """
     Login user and return JWT token
     
@@ -118,7 +125,7 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     - Token must be sent in Authorization header as Bearer token
     """
     
-    user = authenticate_user(db, user_credentials.email, user_credentials.password)
+    user = await authenticate_user_async(db, user_credentials.email, user_credentials.password)
     
     if not user:
         raise HTTPException(
@@ -160,22 +167,31 @@ def get_dashboard(
     - Average ATS score
     - Recent job matches
     """
-    from sqlalchemy import func, desc
-    
-    # Optimized query: Get count and average in single query
-    stats = db.query(
-        func.count(Resume.id).label('total'),
-        func.avg(Resume.ats_score).label('avg_score')
-    ).filter(Resume.user_id == current_user.id).first()
-    
-    total_resumes = stats.total or 0
-    avg_ats_score = round(float(stats.avg_score or 0), 2)
-    
-    # Get latest resume only if exists (optimized query)
-    latest_resume = db.query(Resume).filter(
-        Resume.user_id == current_user.id
-    ).order_by(desc(Resume.created_at)).first()
-    
+    from sqlalchemy import func, select
+
+    # Single round-trip: window functions compute count/avg over all of the
+    # user's resumes while the ORDER BY/LIMIT picks the latest row
+    stmt = (
+        select(
+            Resume,
+            func.count().over().label('total'),
+            func.avg(Resume.ats_score).over().label('avg_score')
+        )
+        .where(Resume.user_id == current_user.id)
+        .order_by(Resume.created_at.desc())
+        .limit(1)
+    )
+    row = db.execute(stmt).first()
+
+    if row:
+        latest_resume = row.Resume
+        total_resumes = row.total
+        avg_ats_score = round(float(row.avg_score or 0), 2)
+    else:
+        latest_resume = None
+        total_resumes = 0
+        avg_ats_score = 0.0
+
     # Get recent matches (placeholder - expand as needed)
     recent_matches = []
     
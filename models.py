@@ -1,7 +1,7 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON
+from sqlalchemy import create_engine, Column, Integer, String, Text, Float, DateTime, ForeignKey, Index, JSON, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from datetime import datetime
+from sqlalchemy.orm import sessionmaker, relationship, deferred
 
 Base = declarative_base()
 
@@ -12,7 +12,7 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     resumes = relationship("Resume", back_populates="user", cascade="all, delete-orphan")
@@ -20,17 +20,24 @@ class User(Base):
 class Resume(Base):
     """Resume model for storing uploaded resumes and analysis"""
     __tablename__ = "resumes"
-    
+    __table_args__ = (
+        # Covers the per-user list and latest-resume dashboard lookups
+        Index("ix_resume_user_created", "user_id", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     filename = Column(String(255), nullable=False)
-    raw_text = Column(Text, nullable=False)
-    extracted_skills = Column(JSON, default=list)
+    # Deferred: list queries skip the multi-KB text column; touching
+    # resume.raw_text issues a targeted load when it is actually needed
+    raw_text = deferred(Column(Text, nullable=False))
+    # JSONB on Postgres so skill intersections can run server-side
+    extracted_skills = Column(JSON().with_variant(JSONB, "postgresql"), default=list)
     technical_skills = Column(JSON, default=list)
     soft_skills = Column(JSON, default=list)
     tools = Column(JSON, default=list)
     ats_score = Column(Float, default=0.0)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="resumes")
@@ -39,12 +46,17 @@ class Resume(Base):
 class Job(Base):
     """Job model for storing job descriptions"""
     __tablename__ = "jobs"
-    
+    __table_args__ = (
+        # Backs the jsonb ?| skill-overlap filter in recommendations
+        Index("ix_job_required_skills_gin", "required_skills", postgresql_using="gin"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False)
+    title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=False)
-    required_skills = Column(JSON, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # JSONB on Postgres so skill intersections can run server-side
+    required_skills = Column(JSON().with_variant(JSONB, "postgresql"), default=list)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     job_matches = relationship("JobMatch", back_populates="job", cascade="all, delete-orphan")
@@ -54,12 +66,12 @@ class JobMatch(Base):
     __tablename__ = "job_matches"
     
     id = Column(Integer, primary_key=True, index=True)
-    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     match_percentage = Column(Float, default=0.0)
     missing_skills = Column(JSON, default=list)
     ai_feedback = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     resume = relationship("Resume", back_populates="job_matches")
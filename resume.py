@@ -1,20 +1,65 @@
+from anyio import CapacityLimiter, to_thread
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import json
+import os
 
 from database import get_db
 from auth import get_current_user
 from models import User, Resume, Job, JobMatch
-from schema import ResumeAnalysis, JobMatchRequest, JobMatchResponse
+from schema import ResumeAnalysis, ResumeListItem, JobMatchRequest, JobMatchResponse
 from utils.pdf_parser import parse_pdf, clean_text
-from utils.skill_extractor import extract_skills
 from utils.ats_scorer import calculate_ats_score
+from utils.text_features import build_features
 from utils.matcher import calculate_match_score
 from utils.ai_feedback import get_ai_feedback
 
 router = APIRouter(prefix="/api/resume", tags=["Resume"])
 
+# Bound CPU-heavy PDF work to the core count so burst uploads queue up
+# instead of spawning unbounded executor threads
+_pdf_limiter = CapacityLimiter(os.cpu_count() or 4)
+
+def _analyze_upload(pdf_file) -> dict:
+    """
+    Full CPU-bound analysis pipeline for an uploaded PDF
+
+    Runs parse, clean, skill extraction and ATS scoring in one thread hop
+    so the event loop is never blocked between stages. Returns kwargs for
+    the Resume row.
+    """
+    raw_text = parse_pdf(pdf_file)
+    cleaned_text = clean_text(raw_text)
+
+    if len(cleaned_text) < 100:
+        raise ValueError("Resume text is too short. Please upload a complete resume.")
+
+    # Lowercase/tokenize/scan the text once and share across both scorers
+    features = build_features(cleaned_text)
+    skills_data = features.skills
+    ats_result = calculate_ats_score(features)
+
+    return {
+        "raw_text": cleaned_text,
+        "extracted_skills": skills_data["all_skills"],
+        "technical_skills": skills_data["technical_skills"],
+        "soft_skills": skills_data["soft_skills"],
+        "tools": skills_data["tools"],
+        "ats_score": ats_result["overall_score"]
+    }
+
+# Reusable statement - built once, compiled SQL is cached across requests
+_RESUME_BY_ID = select(Resume).where(
+    Resume.id == bindparam("rid"),
+    Resume.user_id == bindparam("uid")
+)
+
+def get_user_resume(db: Session, resume_id: int, user_id: int) -> Optional[Resume]:
+    """Fetch a resume owned by the given user using the cached statement"""
+    return db.scalars(_RESUME_BY_ID, {"rid": resume_id, "uid": user_id}).first()
+
 @router.post("/upload", response_model=ResumeAnalysis)
 async def upload_resume(
     file: UploadFile = File(...),
@@ -38,48 +83,30 @@ async def upload_resume(
         )
     
     try:
-        # Validate file size (max 10MB)
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
-        
+        # Validate file size (max 10MB) before any read; UploadFile.size
+        # comes from the multipart parser so no buffering is needed
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, 2)  # Seek to end
+            file_size = file.file.tell()
+            file.file.seek(0)  # Reset to beginning
+
         if file_size > 10 * 1024 * 1024:  # 10MB limit
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail="File too large. Maximum size is 10MB."
             )
-        
-        # Read file content
-        content = await file.read()
-        
-        # Extract text from PDF (run in thread pool to avoid blocking)
-        import asyncio
-        loop = asyncio.get_event_loop()
-        raw_text = await loop.run_in_executor(None, parse_pdf, content)
-        cleaned_text = clean_text(raw_text)
-        
-        if len(cleaned_text) < 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Resume text is too short. Please upload a complete resume."
-            )
-        
-        # Extract skills
-        skills_data = extract_skills(cleaned_text)
-        
-        # Calculate ATS score
-        ats_result = calculate_ats_score(cleaned_text)
-        
+
+        # Run the whole parse/clean/extract/score pipeline in the shared
+        # threadpool in one hop; the spooled upload file is passed directly
+        # instead of being copied into RAM
+        analysis = await to_thread.run_sync(_analyze_upload, file.file, limiter=_pdf_limiter)
+
         # Create resume record
         new_resume = Resume(
             user_id=current_user.id,
             filename=file.filename,
-            raw_text=cleaned_text,
-            extracted_skills=skills_data["all_skills"],
-            technical_skills=skills_data["technical_skills"],
-            soft_skills=skills_data["soft_skills"],
-            tools=skills_data["tools"],
-            ats_score=ats_result["overall_score"]
+            **analysis
         )
         
         db.add(new_resume)
@@ -103,13 +130,15 @@ async def upload_resume(
             detail="Error processing resume. Please ensure the PDF is valid and contains readable text."
         )
 
-@router.get("/list", response_model=List[ResumeAnalysis])
+@router.get("/list", response_model=List[ResumeListItem])
 def get_user_resumes(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all resumes for current user"""
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
+    resumes = db.scalars(
+        select(Resume).where(Resume.user_id == current_user.id)
+    ).all()
     return resumes
 
 @router.get("/{resume_id}", response_model=ResumeAnalysis)
@@ -119,11 +148,8 @@ def get_resume(
     db: Session = Depends(get_db)
 ):
     """Get specific resume by ID"""
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
-    
+    resume = get_user_resume(db, resume_id, current_user.id)
+
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -139,20 +165,18 @@ def analyze_resume(
     db: Session = Depends(get_db)
 ):
     """Re-analyze existing resume and update ATS score"""
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
-    
+    resume = get_user_resume(db, resume_id, current_user.id)
+
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found"
         )
     
-    # Recalculate everything
-    skills_data = extract_skills(resume.raw_text)
-    ats_result = calculate_ats_score(resume.raw_text)
+    # Recalculate everything from one shared feature pass
+    features = build_features(resume.raw_text)
+    skills_data = features.skills
+    ats_result = calculate_ats_score(features)
     
     # Update resume
     resume.extracted_skills = skills_data["all_skills"]
@@ -177,11 +201,8 @@ def delete_resume(
     db: Session = Depends(get_db)
 ):
     """Delete a resume"""
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
-    
+    resume = get_user_resume(db, resume_id, current_user.id)
+
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
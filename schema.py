@@ -37,6 +37,20 @@ class ResumeUpload(BaseModel):
     filename: str
     raw_text: str
 
+class ResumeListItem(BaseModel):
+    """Resume summary for list views - omits the raw_text payload"""
+    id: int
+    filename: str
+    extracted_skills: List[str]
+    technical_skills: List[str]
+    soft_skills: List[str]
+    tools: List[str]
+    ats_score: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class ResumeAnalysis(BaseModel):
     id: int
     filename: str
@@ -66,6 +80,15 @@ class JobCreate(BaseModel):
     description: str = Field(..., min_length=10, max_length=50000)
     required_skills: Optional[List[str]] = Field(default=[], max_length=100)
 
+class JobListItem(BaseModel):
+    """Lightweight job row for list views - no description payload"""
+    id: int
+    title: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class JobResponse(BaseModel):
     id: int
     title: str
@@ -93,7 +116,7 @@ class JobMatchResponse(BaseModel):
 
 class DashboardData(BaseModel):
     user: UserResponse
-    latest_resume: Optional[ResumeAnalysis] = None
+    latest_resume: Optional[ResumeListItem] = None
     total_resumes: int
     average_ats_score: float
     recent_matches: List[Dict[str, Any]]
@@ -1,6 +1,9 @@
+import asyncio
+import hashlib
 import os
-import json
-from typing import Dict, List
+import re
+import orjson
+from typing import Dict, List, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,26 +11,42 @@ load_dotenv()
 # Determine which AI provider to use
 AI_PROVIDER = os.getenv("AI_PROVIDER", "gemini").lower()
 
-def get_ai_feedback(resume_text: str, extracted_skills: List[str], 
-                   job_description: str = "", missing_skills: List[str] = None) -> Dict:
-    """
-    Get AI-powered resume feedback using OpenAI or Gemini
-    
-    Args:
-        resume_text: Resume content
-        extracted_skills: List of extracted skills
-        job_description: Target job description
-        missing_skills: List of missing skills
-        
-    Returns:
-        Dictionary with AI feedback
-    """
-    
+# Max in-flight provider calls for batch feedback (stay under RPM limits)
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "10"))
+
+# Cache provider responses keyed by a hash of the canonicalized inputs -
+# re-evaluating the same resume/job pair skips the LLM round-trip entirely.
+# Fallback (default) feedback is never cached so transient provider errors
+# don't stick.
+_feedback_cache = {}
+_FEEDBACK_CACHE_MAX = 512
+
+def _feedback_cache_key(resume_text: str, extracted_skills: List[str],
+                        job_description: str, missing_skills: List[str]) -> str:
+    raw = "|".join([
+        AI_PROVIDER,
+        resume_text,
+        ",".join(sorted(extracted_skills or [])),
+        job_description,
+        ",".join(sorted(missing_skills or []))
+    ])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+def _feedback_cache_set(key: str, result: Dict) -> None:
+    if len(_feedback_cache) >= _FEEDBACK_CACHE_MAX:
+        # Concurrent evictions may race on the same key; the default keeps
+        # the loser from raising KeyError
+        _feedback_cache.pop(next(iter(_feedback_cache)), None)
+    _feedback_cache[key] = result
+
+def build_prompt(resume_text: str, extracted_skills: List[str],
+                 job_description: str = "", missing_skills: List[str] = None) -> str:
+    """Construct the evaluator prompt shared by the sync and async paths"""
+
     if missing_skills is None:
         missing_skills = []
-    
-    # Construct the prompt
-    prompt = f"""You are a professional ATS resume evaluator and recruiter with 10+ years of experience.
+
+    return f"""You are a professional ATS resume evaluator and recruiter with 10+ years of experience.
 
 Analyze this resume text:
 {resume_text[:3000]}
@@ -63,13 +82,40 @@ Focus on:
 
 Return ONLY valid JSON, no additional text."""
 
+def get_ai_feedback(resume_text: str, extracted_skills: List[str],
+                   job_description: str = "", missing_skills: List[str] = None) -> Dict:
+    """
+    Get AI-powered resume feedback using OpenAI or Gemini
+
+    Args:
+        resume_text: Resume content
+        extracted_skills: List of extracted skills
+        job_description: Target job description
+        missing_skills: List of missing skills
+
+    Returns:
+        Dictionary with AI feedback
+    """
+
+    if missing_skills is None:
+        missing_skills = []
+
+    cache_key = _feedback_cache_key(resume_text, extracted_skills, job_description, missing_skills)
+    cached = _feedback_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    prompt = build_prompt(resume_text, extracted_skills, job_description, missing_skills)
+
     try:
         if AI_PROVIDER == "openai":
-            return get_openai_feedback(prompt)
+            result = get_openai_feedback(prompt)
         elif AI_PROVIDER == "gemini":
-            return get_gemini_feedback(prompt)
+            result = get_gemini_feedback(prompt)
         else:
             return get_default_feedback(extracted_skills, missing_skills)
+        _feedback_cache_set(cache_key, result)
+        return result
     except Exception as e:
         print(f"AI Feedback Error: {e}")
         return get_default_feedback(extracted_skills, missing_skills)
@@ -128,30 +174,135 @@ def get_gemini_feedback(prompt: str) -> Dict:
         print(f"Gemini Error: {e}")
         raise
 
+async def aget_openai_feedback(prompt: str) -> Dict:
+    """Get feedback using the OpenAI async client"""
+    try:
+        import openai
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OpenAI API key not found")
+
+        client = openai.AsyncOpenAI(api_key=api_key)
+
+        response = await client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "You are an expert ATS resume evaluator. Return only valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=1000
+        )
+
+        feedback_text = response.choices[0].message.content.strip()
+        return extract_json(feedback_text)
+
+    except Exception as e:
+        print(f"OpenAI Error: {e}")
+        raise
+
+async def aget_gemini_feedback(prompt: str) -> Dict:
+    """Get feedback using the Gemini async API"""
+    try:
+        import google.generativeai as genai
+
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("Gemini API key not found")
+
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel('gemini-pro')
+
+        response = await model.generate_content_async(prompt)
+        feedback_text = response.text.strip()
+        return extract_json(feedback_text)
+
+    except Exception as e:
+        print(f"Gemini Error: {e}")
+        raise
+
+async def aget_ai_feedback(resume_text: str, extracted_skills: List[str],
+                          job_description: str = "", missing_skills: List[str] = None) -> Dict:
+    """Async variant of get_ai_feedback - awaits the provider instead of blocking"""
+
+    if missing_skills is None:
+        missing_skills = []
+
+    cache_key = _feedback_cache_key(resume_text, extracted_skills, job_description, missing_skills)
+    cached = _feedback_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    prompt = build_prompt(resume_text, extracted_skills, job_description, missing_skills)
+
+    try:
+        if AI_PROVIDER == "openai":
+            result = await aget_openai_feedback(prompt)
+        elif AI_PROVIDER == "gemini":
+            result = await aget_gemini_feedback(prompt)
+        else:
+            return get_default_feedback(extracted_skills, missing_skills)
+        _feedback_cache_set(cache_key, result)
+        return result
+    except Exception as e:
+        print(f"AI Feedback Error: {e}")
+        return get_default_feedback(extracted_skills, missing_skills)
+
+async def abatch_ai_feedback(items: List[Tuple]) -> List[Dict]:
+    """
+    Evaluate many resumes concurrently
+
+    Args:
+        items: List of (resume_text, extracted_skills, job_description,
+            missing_skills) tuples
+
+    Returns:
+        One feedback dict per item, in input order. Calls run in parallel,
+        bounded by AI_MAX_CONCURRENCY, so total latency is roughly the
+        slowest call rather than the sum of all of them.
+    """
+    semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+    async def bounded(item):
+        async with semaphore:
+            return await aget_ai_feedback(*item)
+
+    return await asyncio.gather(*[bounded(item) for item in items])
+
+# Compiled once; extract_json used to rebuild this pattern on every response
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
 def extract_json(text: str) -> Dict:
     """Extract JSON from AI response text"""
-    # Try to find JSON in markdown code blocks
-    import re
-    
-    # Look for JSON in code blocks
-    json_match = re.search(r'```json\s*(\{.*?\})\s*```', text, re.DOTALL)
+    # Look for JSON in markdown code blocks
+    json_match = _JSON_BLOCK_RE.search(text)
     if json_match:
         text = json_match.group(1)
     else:
-        # Look for JSON without code blocks
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(0)
-    
+        # Without code fences, slice from the first to the last brace - a
+        # pair of index scans instead of a DOTALL regex over the response
+        start = text.find('{')
+        end = text.rfind('}')
+        if start != -1 and end > start:
+            text = text[start:end + 1]
+
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         # If parsing fails, return default structure
         raise ValueError("Could not parse AI response as JSON")
 
 def get_default_feedback(extracted_skills: List[str], missing_skills: List[str]) -> Dict:
-    """Provide default feedback when AI is unavailable"""
+    """
+    Provide default feedback when AI is unavailable
+
+    The is_fallback marker lets callers tell canned feedback apart from a
+    real provider response (e.g. to avoid caching it); it is consumed
+    internally and never rendered into user-facing feedback text.
+    """
     return {
+        "is_fallback": True,
         "ats_score": 70,
         "missing_skills": missing_skills[:10] if missing_skills else [],
         "improvements": [
@@ -1,8 +1,124 @@
 import re
-from typing import Dict
-from utils.skill_extractor import extract_skills, extract_keywords, count_action_verbs
+from typing import Dict, Union
 
-def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str, float]:
+from utils.text_features import TextFeatures, build_features
+
+try:
+    import ahocorasick
+except ImportError:  # optional - per-keyword scans below cover the fallback
+    ahocorasick = None
+
+from utils.skill_extractor import (
+    ACTION_VERBS,
+    count_action_verbs,
+    extract_skills,
+    extract_keywords,
+    _compile_union,
+    _is_word_boundary
+)
+
+# Combined formatting pattern, compiled once at import. Emails, phone
+# numbers, dates and quantified numbers are tallied in a single finditer
+# pass over the resume instead of four independent scans of the same text.
+_FMT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'
+    r'|(?P<date>\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4}\b'
+    r'|\b\d{4}\s*[-–]\s*(?:\d{4}|present)\b)'
+    r'|(?P<num>\b\d+[%$kKmM]?\b)',
+    re.IGNORECASE
+)
+_NUMBER_RE = re.compile(r'\b\d+[%$kKmM]?\b')
+
+def _scan_formats(text: str) -> Dict[str, int]:
+    """Count email/phone/date/number hits in one pass over the text"""
+    counts = {"email": 0, "phone": 0, "date": 0, "num": 0}
+    for match in _FMT_RE.finditer(text):
+        group = match.lastgroup
+        counts[group] += 1
+        if group != "num":
+            # The alternation consumes the whole email/phone/date span, but
+            # the years and digit groups inside it still count toward the
+            # number tally, as they did when the scans ran independently
+            counts["num"] += len(_NUMBER_RE.findall(match.group()))
+    return counts
+
+_IMPORTANT_SECTIONS = frozenset({
+    'experience', 'education', 'skills', 'projects', 'certifications',
+    'summary', 'objective', 'achievements', 'work history'
+})
+_EXPERIENCE_KEYWORDS = frozenset({
+    'developed', 'managed', 'led', 'implemented', 'designed',
+    'created', 'improved', 'increased', 'reduced', 'achieved'
+})
+_BULLET_CHARS = frozenset('•●▪■-*')
+
+def _build_keyword_automaton():
+    """
+    Build one tagged automaton over sections, experience keywords and
+    action verbs so the scorer tallies all three in a single text pass
+
+    Keywords can belong to several categories (e.g. 'developed' is both an
+    experience keyword and an action verb), so each entry carries a tag tuple.
+    """
+    tags_by_keyword = {}
+    for section in _IMPORTANT_SECTIONS:
+        tags_by_keyword.setdefault(section, []).append('section')
+    for keyword in _EXPERIENCE_KEYWORDS:
+        tags_by_keyword.setdefault(keyword, []).append('exp_verb')
+    for verb in ACTION_VERBS:
+        tags_by_keyword.setdefault(verb, []).append('action_verb')
+
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in tags_by_keyword.items():
+        automaton.add_word(keyword, (keyword, tuple(tags)))
+    automaton.make_automaton()
+    return automaton
+
+# Built once per process; the union regexes are the lightweight fallback
+# and enforce the same word-boundary semantics as the automaton pass
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = _build_keyword_automaton()
+    _SECTIONS_RE = _EXP_RE = None
+else:
+    _KEYWORD_AUTOMATON = None
+    _SECTIONS_RE = _compile_union(_IMPORTANT_SECTIONS)
+    _EXP_RE = _compile_union(_EXPERIENCE_KEYWORDS)
+
+def _count_keywords(text_lower: str) -> Dict:
+    """Tally section/experience/action-verb hits in one automaton pass"""
+    if _KEYWORD_AUTOMATON is None:
+        # Fallback without pyahocorasick: one boundary-anchored scan per
+        # keyword group, so hits match the automaton path (no substring
+        # hits like 'experience' inside 'experienced')
+        return {
+            "sections_found": len(set(_SECTIONS_RE.findall(text_lower))),
+            "exp_count": len(set(_EXP_RE.findall(text_lower))),
+            "action_verb_count": count_action_verbs(text_lower)
+        }
+
+    sections = set()
+    exp_keywords = set()
+    action_verb_count = 0
+
+    for end_idx, (keyword, tags) in _KEYWORD_AUTOMATON.iter(text_lower):
+        start_idx = end_idx - len(keyword) + 1
+        if not _is_word_boundary(text_lower, start_idx, end_idx):
+            continue
+        if 'section' in tags:
+            sections.add(keyword)
+        if 'exp_verb' in tags:
+            exp_keywords.add(keyword)
+        if 'action_verb' in tags:
+            action_verb_count += 1
+
+    return {
+        "sections_found": len(sections),
+        "exp_count": len(exp_keywords),
+        "action_verb_count": action_verb_count
+    }
+
+def calculate_ats_score(resume_text: Union[str, TextFeatures], job_description: str = "") -> Dict[str, float]:
     """
     Calculate ATS score based on multiple factors
     
@@ -21,11 +137,16 @@ def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str
         Dictionary with overall score and component scores
     """
     
+    # Accept precomputed features so callers scoring the same resume through
+    # several passes lowercase/tokenize/scan it only once
+    features = resume_text if isinstance(resume_text, TextFeatures) else build_features(resume_text)
+    resume_text = features.text
+
     # Extract skills and keywords
-    skills_data = extract_skills(resume_text)
+    skills_data = features.skills
     all_skills = skills_data["all_skills"]
     technical_skills = skills_data["technical_skills"]
-    
+
     # Initialize scores
     scores = {
         "keyword_density": 0.0,
@@ -39,13 +160,12 @@ def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str
     # 1. KEYWORD DENSITY (40%)
     # ====================================
     # Check for important sections and keywords
-    text_lower = resume_text.lower()
-    
-    important_sections = [
-        'experience', 'education', 'skills', 'projects', 'certifications',
-        'summary', 'objective', 'achievements', 'work history'
-    ]
-    sections_found = sum(1 for section in important_sections if section in text_lower)
+    text_lower = features.text_lower
+
+    # Sections, experience keywords and action verbs tallied in one pass
+    keyword_counts = _count_keywords(text_lower)
+
+    sections_found = keyword_counts["sections_found"]
     section_score = min(sections_found / 6 * 100, 100)  # Max 100%
     
     # Check keyword density (number of relevant keywords)
@@ -61,33 +181,30 @@ def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str
     # 2. RESUME FORMATTING (20%)
     # ====================================
     formatting_score = 0
-    
+
+    # Emails, phone numbers, dates and quantified numbers in one scan
+    format_counts = _scan_formats(resume_text)
+
     # Check for email
-    if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text):
+    if format_counts["email"]:
         formatting_score += 20
-    
+
     # Check for phone number
-    if re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', resume_text):
+    if format_counts["phone"]:
         formatting_score += 20
-    
+
     # Check for dates (experience timeline)
-    date_patterns = [
-        r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4}\b',
-        r'\b\d{4}\s*[-–]\s*\d{4}\b',
-        r'\b\d{4}\s*[-–]\s*present\b'
-    ]
-    dates_found = any(re.search(pattern, text_lower) for pattern in date_patterns)
-    if dates_found:
+    if format_counts["date"]:
         formatting_score += 20
-    
-    # Check for bullet points or structured content
-    bullet_indicators = ['•', '●', '▪', '■', '-', '*']
-    has_bullets = any(indicator in resume_text for indicator in bullet_indicators)
+
+    # Check for bullet points or structured content (one C-level substring
+    # scan per bullet character, over the full text)
+    has_bullets = any(ch in resume_text for ch in _BULLET_CHARS)
     if has_bullets:
         formatting_score += 20
     
     # Check for reasonable length (400-2000 words)
-    word_count = len(resume_text.split())
+    word_count = features.word_count
     if 400 <= word_count <= 2000:
         formatting_score += 20
     elif word_count > 300:
@@ -98,7 +215,7 @@ def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str
     # ====================================
     # 3. ACTION VERBS USAGE (15%)
     # ====================================
-    action_verb_count = count_action_verbs(resume_text)
+    action_verb_count = keyword_counts["action_verb_count"]
     # Target: 15+ action verbs for strong resume
     scores["action_verbs"] = min(action_verb_count / 15 * 100, 100)
     
@@ -108,16 +225,13 @@ def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str
     experience_score = 0
     
     # Check for quantifiable achievements (numbers in text)
-    numbers = re.findall(r'\b\d+[%$kKmM]?\b', resume_text)
-    if len(numbers) >= 5:
+    if format_counts["num"] >= 5:
         experience_score += 50
-    elif len(numbers) >= 2:
+    elif format_counts["num"] >= 2:
         experience_score += 25
     
     # Check for experience indicators
-    experience_keywords = ['developed', 'managed', 'led', 'implemented', 'designed', 
-                          'created', 'improved', 'increased', 'reduced', 'achieved']
-    exp_count = sum(1 for keyword in experience_keywords if keyword in text_lower)
+    exp_count = keyword_counts["exp_count"]
     experience_score += min(exp_count / 5 * 50, 50)
     
     scores["experience"] = experience_score
@@ -127,8 +241,8 @@ def calculate_ats_score(resume_text: str, job_description: str = "") -> Dict[str
     # ====================================
     if job_description:
         job_skills = extract_skills(job_description)
-        job_all_skills = set([s.lower() for s in job_skills["all_skills"]])
-        resume_all_skills = set([s.lower() for s in all_skills])
+        job_all_skills = {s.lower() for s in job_skills["all_skills"]}
+        resume_all_skills = {s.lower() for s in all_skills}
         
         if job_all_skills:
             matched_skills = resume_all_skills & job_all_skills
@@ -1,10 +1,27 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Dict, List, Tuple
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.metrics.pairwise import linear_kernel
+from typing import Dict, List, Tuple, Union
 import numpy as np
 from utils.skill_extractor import extract_skills
+from utils.text_features import TextFeatures, build_features
+from utils.parallel import CPU_POOL
 
-def calculate_match_score(resume_text: str, job_description: str) -> Dict:
+# Below this many resumes, process-pool dispatch costs more in pickling and
+# IPC than the extraction it parallelizes
+_PARALLEL_MIN_RESUMES = 4
+
+# Stateless vectorizer shared across calls - no per-call vocabulary build or
+# IDF fit (IDF is meaningless on two documents anyway). Rows come out
+# L2-normalized, so cosine similarity is a plain dot product.
+_HV = HashingVectorizer(
+    n_features=2**18,
+    alternate_sign=False,
+    norm='l2',
+    stop_words='english'
+)
+
+def calculate_match_score(resume_text: Union[str, TextFeatures],
+                          job_description: Union[str, TextFeatures]) -> Dict:
     """
     Calculate job match score using cosine similarity and skill matching
     
@@ -16,16 +33,22 @@ def calculate_match_score(resume_text: str, job_description: str) -> Dict:
         Dictionary with match percentage, matched skills, and missing skills
     """
     
-    # Extract skills from both texts
-    resume_skills = extract_skills(resume_text)
-    job_skills = extract_skills(job_description)
+    # Accept precomputed features so repeat scoring of the same text reuses
+    # its skills instead of re-scanning
+    resume_features = resume_text if isinstance(resume_text, TextFeatures) else build_features(resume_text)
+    job_features = job_description if isinstance(job_description, TextFeatures) else build_features(job_description)
+    resume_text = resume_features.text
+    job_description = job_features.text
+
+    resume_skills = resume_features.skills
+    job_skills = job_features.skills
     
     # Convert skill lists to sets for comparison
-    resume_all_skills = set([s.lower() for s in resume_skills["all_skills"]])
-    job_all_skills = set([s.lower() for s in job_skills["all_skills"]])
-    
-    resume_technical = set([s.lower() for s in resume_skills["technical_skills"]])
-    job_technical = set([s.lower() for s in job_skills["technical_skills"]])
+    resume_all_skills = {s.lower() for s in resume_skills["all_skills"]}
+    job_all_skills = {s.lower() for s in job_skills["all_skills"]}
+
+    resume_technical = {s.lower() for s in resume_skills["technical_skills"]}
+    job_technical = {s.lower() for s in job_skills["technical_skills"]}
     
     # Calculate skill-based match
     matched_skills = resume_all_skills & job_all_skills
@@ -45,24 +68,12 @@ def calculate_match_score(resume_text: str, job_description: str) -> Dict:
     else:
         technical_match_rate = 0.5
     
-    # Calculate cosine similarity using TF-IDF
-    # Use try-except to handle edge cases
-    cosine_sim = 0.5  # Default fallback
-    try:
-        # Ensure texts are not empty
-        if len(resume_text.strip()) > 10 and len(job_description.strip()) > 10:
-            vectorizer = TfidfVectorizer(
-                stop_words='english',
-                max_features=500,
-                min_df=1,
-                max_df=0.95
-            )
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_description])
-            cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-    except Exception as e:
-        print(f"TF-IDF calculation warning: {e}")
-        # Continue with default cosine_sim value
-    
+    # Calculate cosine similarity on hashed term vectors
+    cosine_sim = 0.5  # Default fallback for near-empty texts
+    if len(resume_text.strip()) > 10 and len(job_description.strip()) > 10:
+        matrix = _HV.transform([resume_text, job_description])
+        cosine_sim = float(matrix[0].multiply(matrix[1]).sum())
+
     # Calculate weighted match score
     # 40% skill match, 30% technical match, 30% cosine similarity
     final_match = (
@@ -74,10 +85,10 @@ def calculate_match_score(resume_text: str, job_description: str) -> Dict:
     # Prepare results
     result = {
         "match_percentage": round(final_match, 2),
-        "matched_skills": sorted(list(matched_skills)),
-        "missing_skills": sorted(list(missing_skills)),
-        "matched_technical_skills": sorted(list(matched_technical)),
-        "missing_technical_skills": sorted(list(missing_technical)),
+        "matched_skills": sorted(matched_skills),
+        "missing_skills": sorted(missing_skills),
+        "matched_technical_skills": sorted(matched_technical),
+        "missing_technical_skills": sorted(missing_technical),
         "cosine_similarity": round(cosine_sim * 100, 2)
     }
     
@@ -94,15 +105,48 @@ def rank_resumes(resumes: List[str], job_description: str) -> List[Tuple[int, fl
     Returns:
         List of tuples (resume_index, match_score) sorted by score descending
     """
+    if not resumes:
+        return []
+
+    # Vectorize every text in one transform; linear_kernel dispatches the
+    # whole batch of inner products to one optimized sparse matmul (rows are
+    # already L2-normalized, so this is cosine similarity)
+    matrix = _HV.transform(resumes + [job_description])
+    sims = linear_kernel(matrix[:-1], matrix[-1:]).ravel()
+
+    # Extract job skills once instead of once per resume
+    job_skills = extract_skills(job_description)
+    job_all = frozenset(s.lower() for s in job_skills["all_skills"])
+    job_technical = frozenset(s.lower() for s in job_skills["technical_skills"])
+
+    # Per-resume extraction is independent, so large batches fan out across
+    # the shared process pool; small batches stay serial
+    if len(resumes) >= _PARALLEL_MIN_RESUMES:
+        all_resume_skills = list(CPU_POOL.map(extract_skills, resumes))
+    else:
+        all_resume_skills = [extract_skills(resume) for resume in resumes]
+
     scores = []
-    
-    for idx, resume in enumerate(resumes):
-        match_result = calculate_match_score(resume, job_description)
-        scores.append((idx, match_result["match_percentage"]))
-    
+    for idx, resume_skills in enumerate(all_resume_skills):
+        resume_all = {s.lower() for s in resume_skills["all_skills"]}
+        resume_technical = {s.lower() for s in resume_skills["technical_skills"]}
+
+        skill_match_rate = len(resume_all & job_all) / len(job_all) if job_all else 0.5
+        technical_match_rate = (
+            len(resume_technical & job_technical) / len(job_technical) if job_technical else 0.5
+        )
+
+        # Same weighting as calculate_match_score
+        final_match = (
+            skill_match_rate * 0.40 +
+            technical_match_rate * 0.30 +
+            float(sims[idx]) * 0.30
+        ) * 100
+        scores.append((idx, round(final_match, 2)))
+
     # Sort by score descending
     scores.sort(key=lambda x: x[1], reverse=True)
-    
+
     return scores
 
 def get_match_interpretation(score: float) -> str:
@@ -0,0 +1,9 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared process pool for CPU-bound work that holds the GIL (skill
+# extraction, scoring), one worker per core, reused across requests so no
+# call pays executor spawn cost. Workers are only spawned on first submit,
+# so importing this module is free. Blocking I/O goes through anyio's
+# threadpool and the async provider clients instead.
+CPU_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 4)
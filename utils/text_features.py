@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+from utils.skill_extractor import extract_skills
+
+@dataclass
+class TextFeatures:
+    """
+    Precomputed features for one text, shared across scoring passes
+
+    calculate_ats_score, calculate_match_score and the upload pipeline all
+    need the lowercased text, word count and extracted skills - building
+    them once here replaces repeated lowercasing/counting/scanning of the
+    same resume.
+    """
+    text: str
+    text_lower: str
+    # Whitespace-split count, not a regex-token count: the scorer's length
+    # thresholds were defined against len(text.split())
+    word_count: int
+    skills: Dict[str, List[str]]
+
+def build_features(text: str) -> TextFeatures:
+    """Build the shared features for a text (one pass per representation)"""
+    if not text or not isinstance(text, str):
+        text = ""
+
+    return TextFeatures(
+        text=text,
+        text_lower=text.lower(),
+        word_count=len(text.split()),
+        skills=extract_skills(text)
+    )